@@ -1,34 +1,75 @@
 import asyncio
 import collections
 import functools
+import inspect
 import logging
 import ssl as _ssl
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union  # noqa
 
-from bottom.pack import pack_command
+from bottom.pack import pack_command_kwargs
 from bottom.protocol import Protocol
-from bottom.unpack import unpack_command
+from bottom.unpack import try_unpack_command
+
+
+async def end_of_handlers(message: str) -> None:
+    """
+    The next_handler given to the last raw handler.  Handlers may compare
+    against it to skip awaiting a no-op.
+    """
 
 
 async def process(handlers: List[Callable], message: str) -> None:
     if not handlers:
         return
 
-    # noinspection PyShadowingNames
-    async def noop_handler(next_handler: Callable, message: str) -> None:
-        assert not handler_queue
-
-    handler_queue = collections.deque([*handlers, noop_handler])
+    # Snapshot the chain and walk it by index
+    chain = tuple(handlers)
+    count = len(chain)
+    index = 0
 
     # noinspection PyShadowingNames
     async def next_handler(message: str) -> None:
-        handler = handler_queue.popleft()  # type: Any
+        nonlocal index
+        handler = chain[index]  # type: Any
+        index += 1
         assert asyncio.iscoroutinefunction(handler)
-        await handler(next_handler, message)
+        if index < count:
+            await handler(next_handler, message)
+        else:
+            await handler(end_of_handlers, message)
 
     await next_handler(message)
 
 
+def ensure_async(func: Callable) -> Callable:
+    """
+    Wrap a plain function in a native coroutine function so it can be
+    scheduled like any other handler.  Coroutine functions are returned
+    unchanged.  Like asyncio.coroutine, anything awaitable the function
+    returns (eg. from an async __call__) is awaited.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    async def wrapped(*args: Any, **kwargs: Any) -> Any:
+        result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    return wrapped
+
+
+@functools.lru_cache(maxsize=512)
+def normalize_event(event: str) -> str:
+    """
+    Event names are case-insensitive.  The set of names a client sees is small
+    and fixed, so the normalized string is cached instead of re-created on
+    every trigger.
+    """
+    return event.upper()
+
+
 class RawClient:
     protocol = None  # type: Optional[Protocol]
     raw_handlers = None  # type: List[Callable]
@@ -50,8 +91,8 @@ class RawClient:
         self._loop = loop
 
         self._event_handlers = collections.defaultdict(list)
-        self._events = collections.defaultdict(
-            lambda: asyncio.Event(loop=self.loop))
+        # Events are only created inside `wait`, which runs on self.loop
+        self._events = collections.defaultdict(asyncio.Event)
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -94,18 +135,22 @@ class RawClient:
 
     def trigger(self, event: str, **kwargs: Any) -> None:
         """Trigger all handlers for an event to (asynchronously) execute"""
-        event = event.upper()
+        event = normalize_event(event)
         for func in self._event_handlers[event]:
             self.loop.create_task(func(**kwargs))
+        # Events are only created by `wait`, so there's nothing to unblock
+        # for names that no one has ever waited on.
+        async_event = self._events.get(event)
+        if async_event is None:
+            return
         # This will unblock anyone that is awaiting on the next loop update,
         # while still ensuring the next `await client.wait(event)` doesn't
         # immediately fire.
-        async_event = self._events[event]
         async_event.set()
         async_event.clear()
 
     async def wait(self, event: str) -> str:
-        await self._events[event.upper()].wait()
+        await self._events[normalize_event(event)].wait()
         return event
 
     def on(self, event: str, func: Optional[Callable] = None) -> Callable:
@@ -135,10 +180,8 @@ class RawClient:
         """
         if func is None:
             return functools.partial(self.on, event)
-        wrapped = func
-        if not asyncio.iscoroutinefunction(wrapped):
-            wrapped = asyncio.coroutine(wrapped)
-        self._event_handlers[event.upper()].append(wrapped)
+        wrapped = ensure_async(func)
+        self._event_handlers[normalize_event(event)].append(wrapped)
         # Always return original
         return func
 
@@ -178,7 +221,8 @@ class Client(RawClient):
             client.send("privmsg", target="#python", message="Hello, World!")
 
         """
-        packed_command = pack_command(command, **kwargs).strip()
+        # Subclasses may override send_raw, so hand it the trimmed line
+        packed_command = pack_command_kwargs(command, kwargs).strip()
         self.send_raw(packed_command)
 
 
@@ -188,9 +232,18 @@ rfc2812_log = logging.getLogger('bottom.rfc2812_handler')
 def rfc2812_handler(client: RawClient) -> Callable:
     async def handler(next_handler: Callable, message: str) -> None:
         try:
-            event, kwargs = unpack_command(message)
-            client.trigger(event, **kwargs)
+            unpacked = try_unpack_command(message)
         except ValueError:
-            rfc2812_log.debug("Failed to parse line >>> {}".format(message))
-        await next_handler(message)
+            # Known command with malformed parameters
+            unpacked = None
+        if unpacked is None:
+            # Unknown replies are routine; don't build a record for each
+            # one unless debug logging is actually on
+            if rfc2812_log.isEnabledFor(logging.DEBUG):
+                rfc2812_log.debug("Failed to parse line >>> %s", message)
+        else:
+            event, kwargs = unpacked
+            client.trigger(event, **kwargs)
+        if next_handler is not end_of_handlers:
+            await next_handler(message)
     return handler
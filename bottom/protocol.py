@@ -12,19 +12,19 @@ DELIM_COMPAT = b"\n"
 
 
 class Protocol(asyncio.Protocol):
-    client = None  # type: RawClient
-    transport = None  # type: asyncio.WriteTransport
+    # Every read and write goes through these, so skip the instance dict
+    __slots__ = ("client", "transport", "closed", "buffer")
 
     def __init__(self, client: 'Optional[RawClient]' = None) -> None:
         if client is not None:
-            self.client = client
+            self.client = client  # type: RawClient
         self.closed = False  # type: bool
         self.buffer = b""  # type: bytes
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         if MYPY:
             assert isinstance(transport, asyncio.WriteTransport)
-        self.transport = transport
+        self.transport = transport  # type: asyncio.WriteTransport
 
     def connection_lost(self, exc: Optional[Exception]) -> None:
         if not self.closed:
@@ -34,12 +34,17 @@ class Protocol(asyncio.Protocol):
 
     def data_received(self, data: bytes) -> None:
         self.buffer += data
-        # All but the last result of split should be pushed into the
-        # client.  The last will be b"" if the buffer ends on b"\n"
-        *lines, self.buffer = self.buffer.split(DELIM_COMPAT)
+        # Everything up to the last b"\n" is a complete line.  Decode those
+        # in a single pass and keep the (possibly empty) remainder buffered
+        end = self.buffer.rfind(DELIM_COMPAT) + 1
+        if not end:
+            return
+        complete, self.buffer = self.buffer[:end], self.buffer[end:]
+        client = self.client
+        *lines, _ = complete.decode(client.encoding, "ignore").split("\n")
+        handle_raw = client.handle_raw
         for line in lines:
-            message = line.decode(self.client.encoding, "ignore").strip()
-            self.client.handle_raw(message)
+            handle_raw(line.strip())
 
     def write(self, message: str) -> None:
         message = message.strip()
@@ -1,7 +1,8 @@
 """ Simplified support for rfc2812 """
 # https://tools.ietf.org/html/rfc2812
 import re
-from typing import Any, Dict, List, Pattern, Tuple  # noqa
+import sys
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple  # noqa
 
 
 RE_IRCLINE = re.compile(
@@ -167,6 +168,21 @@ for numeric, string in [
     _2812_synonyms[numeric] = string
 
 
+# Commands that share a kwargs layout, used by both unpack_command
+# and parameters so the two never drift apart
+_MESSAGE_COMMANDS = ("PING", "ERR_NOMOTD")
+_TARGETED_COMMANDS = ("PRIVMSG", "NOTICE")
+_CHANNEL_MESSAGE_REPLIES = ("RPL_TOPIC", "RPL_NOTOPIC", "RPL_ENDOFNAMES")
+_MESSAGE_REPLIES = ("RPL_MOTDSTART", "RPL_MOTD", "RPL_ENDOFMOTD",
+                    "RPL_WELCOME", "RPL_YOURHOST", "RPL_CREATED",
+                    "RPL_LUSERCLIENT", "RPL_LUSERME")
+_COUNT_REPLIES = ("RPL_LUSEROP", "RPL_LUSERUNKNOWN", "RPL_LUSERCHANNELS")
+_INFO_REPLIES = ("RPL_MYINFO", "RPL_BOUNCE")
+# Maps the hot path's freshly split verb to the canonical (interned) name,
+# so Client.trigger always hashes a string whose hash is already cached
+_HOT_COMMANDS = {command: command for command in _TARGETED_COMMANDS}
+
+
 def synonym(command: str) -> str:
     command = command.upper()
     return _2812_synonyms.get(command, command)
@@ -183,233 +199,319 @@ def nickmask(prefix: str, kwargs: Dict[str, Any]) -> None:
         kwargs["host"] = prefix
 
 
-def add_nickmask(params: List[str]) -> None:
-    params.extend(["nick", "user", "host"])
-
-
 def split_line(msg: str) -> Tuple[str, str, List[str]]:
     """ Parse message according to rfc 2812 for routing """
-    match = RE_IRCLINE.match(msg)
-    if not match:
+    parts = try_split_line(msg)
+    if parts is None:
         raise ValueError("Invalid line")
+    return parts
 
-    prefix = match.group("prefix") or ""
-    command = match.group("command")
-    params = (match.group("params") or "").split()
-    message = match.group("message") or ""
 
+def try_split_line(msg: str) -> Optional[Tuple[str, str, List[str]]]:
+    """ Same as split_line, but returns None for an invalid line """
+    match = RE_IRCLINE.match(msg)
+    if not match:
+        return None
+
+    # One call into the match object instead of one per group
+    prefix, command, raw_params, message = match.group(
+        "prefix", "command", "params", "message")
+    params = raw_params.split()  # type: List[str]
     if message:
         params.append(message)
 
-    return prefix, command, params
+    return prefix or "", command, params
 
 
-def unpack_command(msg: str) -> Tuple[str, Dict[str, Any]]:
-    prefix, command, params = split_line(msg.strip())
-    command = synonym(command)
-    kwargs = {}  # type: Dict[str, Any]
+# Each unpacker fills kwargs from a split line and returns the event name
+Unpacker = Callable[[str, str, List[str], Dict[str, Any]], str]
+_unpackers = {}  # type: Dict[str, Unpacker]
 
-    if command in ["PING", "ERR_NOMOTD"]:
-        kwargs["message"] = params[-1]
 
-    elif command in ["PRIVMSG", "NOTICE"]:
-        nickmask(prefix, kwargs)
-        kwargs["target"] = params[0]
-        kwargs["message"] = params[-1]
+def unpacks(*commands: str) -> Callable[[Unpacker], Unpacker]:
+    """ Register an unpacker for one or more (synonym) commands """
+    def register(unpacker: Unpacker) -> Unpacker:
+        for command in commands:
+            command = sys.intern(command)
+            _unpackers[command] = unpacker
+            # synonym() then hands back this same string object for every
+            # line, so downstream event lookups compare by identity
+            _2812_synonyms.setdefault(command, command)
+        return unpacker
+    return register
 
-    elif command in ["JOIN"]:
-        nickmask(prefix, kwargs)
-        kwargs["channel"] = params[0]
 
-    elif command in ["NICK"]:
-        nickmask(prefix, kwargs)
-        kwargs["new_nick"] = params[0]
+@unpacks(*_MESSAGE_COMMANDS)
+def _unpack_message(command: str, prefix: str, params: List[str],
+                    kwargs: Dict[str, Any]) -> str:
+    kwargs["message"] = params[-1]
+    return command
 
-    elif command in ["RPL_NAMREPLY"]:
-        kwargs["target"] = params[0]
-        if len(params) > 3:
-            kwargs["channel_type"] = params[1]
-        else:
-            kwargs["channel_type"] = None
-        kwargs["channel"] = params[-2]
-        kwargs["users"] = params[-1].split(" ")
-
-    elif command in ["RPL_WHOREPLY"]:
-        """ 352 RPL_WHOREPLY
-              <channel> <user> <host> <server> <nick>
-              ( "H" / "G" > ["*"] [ ( "@" / "+" ) ]
-              :<hopcount> <real name>"
-        """
-        (kwargs["target"],
-         kwargs["channel"],
-         kwargs["user"],
-         kwargs["host"],
-         kwargs["server"],
-         kwargs["nick"],
-         kwargs["hg_code"]) = params[0:7]
-        hc, kwargs["real_name"] = params[-1].split(" ", 1)
-        kwargs["hopcount"] = int(hc)
-
-    elif command in ["RPL_ENDOFWHO"]:
-        kwargs["name"] = params[0]
-        kwargs["message"] = params[1]
 
-    elif command in ["QUIT"]:
-        nickmask(prefix, kwargs)
-        if params:
-            kwargs["message"] = params[0]
-        else:
-            kwargs["message"] = ""
+@unpacks(*_TARGETED_COMMANDS)
+def _unpack_targeted(command: str, prefix: str, params: List[str],
+                     kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    kwargs["target"] = params[0]
+    kwargs["message"] = params[-1]
+    return command
+
+
+@unpacks("JOIN")
+def _unpack_join(command: str, prefix: str, params: List[str],
+                 kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    kwargs["channel"] = params[0]
+    return command
 
-    elif command in ["PART"]:
-        nickmask(prefix, kwargs)
-        kwargs["channel"] = params[0]
-        if len(params) > 1:
-            kwargs["message"] = params[-1]
-        else:
-            kwargs["message"] = ""
 
-    elif command in ["INVITE"]:
-        nickmask(prefix, kwargs)
-        kwargs["target"] = params[0]
-        kwargs["channel"] = params[1]
+@unpacks("NICK")
+def _unpack_nick(command: str, prefix: str, params: List[str],
+                 kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    kwargs["new_nick"] = params[0]
+    return command
 
-    elif command in ["RPL_TOPIC", "RPL_NOTOPIC", "RPL_ENDOFNAMES"]:
-        kwargs["channel"] = params[1]
-        kwargs["message"] = params[2]
 
-    elif command in ["RPL_MOTDSTART", "RPL_MOTD", "RPL_ENDOFMOTD",
-                     "RPL_WELCOME", "RPL_YOURHOST", "RPL_CREATED",
-                     "RPL_LUSERCLIENT", "RPL_LUSERME"]:
+@unpacks("RPL_NAMREPLY")
+def _unpack_namreply(command: str, prefix: str, params: List[str],
+                     kwargs: Dict[str, Any]) -> str:
+    kwargs["target"] = params[0]
+    if len(params) > 3:
+        kwargs["channel_type"] = params[1]
+    else:
+        kwargs["channel_type"] = None
+    kwargs["channel"] = params[-2]
+    kwargs["users"] = params[-1].split(" ")
+    return command
+
+
+@unpacks("RPL_WHOREPLY")
+def _unpack_whoreply(command: str, prefix: str, params: List[str],
+                     kwargs: Dict[str, Any]) -> str:
+    """ 352 RPL_WHOREPLY
+          <channel> <user> <host> <server> <nick>
+          ( "H" / "G" > ["*"] [ ( "@" / "+" ) ]
+          :<hopcount> <real name>"
+    """
+    (kwargs["target"],
+     kwargs["channel"],
+     kwargs["user"],
+     kwargs["host"],
+     kwargs["server"],
+     kwargs["nick"],
+     kwargs["hg_code"]) = params[0:7]
+    hc, kwargs["real_name"] = params[-1].split(" ", 1)
+    kwargs["hopcount"] = int(hc)
+    return command
+
+
+@unpacks("RPL_ENDOFWHO")
+def _unpack_endofwho(command: str, prefix: str, params: List[str],
+                     kwargs: Dict[str, Any]) -> str:
+    kwargs["name"] = params[0]
+    kwargs["message"] = params[1]
+    return command
+
+
+@unpacks("QUIT")
+def _unpack_quit(command: str, prefix: str, params: List[str],
+                 kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    if params:
+        kwargs["message"] = params[0]
+    else:
+        kwargs["message"] = ""
+    return command
+
+
+@unpacks("PART")
+def _unpack_part(command: str, prefix: str, params: List[str],
+                 kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    kwargs["channel"] = params[0]
+    if len(params) > 1:
         kwargs["message"] = params[-1]
+    else:
+        kwargs["message"] = ""
+    return command
 
-    elif command in ["RPL_LUSEROP", "RPL_LUSERUNKNOWN", "RPL_LUSERCHANNELS"]:
-        kwargs["count"] = int(params[1])
-        if len(params) > 2:
-            kwargs["message"] = params[-1]
-        else:
-            kwargs["message"] = ""
 
-    elif command in ["RPL_MYINFO", "RPL_BOUNCE"]:
-        kwargs["info"] = params[1:-1]
+@unpacks("INVITE")
+def _unpack_invite(command: str, prefix: str, params: List[str],
+                   kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    kwargs["target"] = params[0]
+    kwargs["channel"] = params[1]
+    return command
+
+
+@unpacks(*_CHANNEL_MESSAGE_REPLIES)
+def _unpack_channel_message(command: str, prefix: str, params: List[str],
+                            kwargs: Dict[str, Any]) -> str:
+    kwargs["channel"] = params[1]
+    kwargs["message"] = params[2]
+    return command
+
+
+@unpacks(*_MESSAGE_REPLIES)
+def _unpack_message_reply(command: str, prefix: str, params: List[str],
+                          kwargs: Dict[str, Any]) -> str:
+    kwargs["message"] = params[-1]
+    return command
+
+
+@unpacks(*_COUNT_REPLIES)
+def _unpack_count(command: str, prefix: str, params: List[str],
+                  kwargs: Dict[str, Any]) -> str:
+    kwargs["count"] = int(params[1])
+    if len(params) > 2:
         kwargs["message"] = params[-1]
+    else:
+        kwargs["message"] = ""
+    return command
+
+
+@unpacks(*_INFO_REPLIES)
+def _unpack_info(command: str, prefix: str, params: List[str],
+                 kwargs: Dict[str, Any]) -> str:
+    kwargs["info"] = params[1:-1]
+    kwargs["message"] = params[-1]
+    return command
+
+
+@unpacks("TOPIC")
+def _unpack_topic(command: str, prefix: str, params: List[str],
+                  kwargs: Dict[str, Any]) -> str:
+    kwargs["channel"] = params[0]
+    if len(params) > 1:
+        kwargs["message"] = params[1]
+    else:
+        kwargs["message"] = ""
+    return command
+
 
-    elif command in ["TOPIC"]:
+@unpacks("MODE")
+def _unpack_mode(command: str, prefix: str, params: List[str],
+                 kwargs: Dict[str, Any]) -> str:
+    nickmask(prefix, kwargs)
+    if params[0][0] in "&#!+":
         kwargs["channel"] = params[0]
-        if len(params) > 1:
-            kwargs["message"] = params[1]
-        else:
-            kwargs["message"] = ""
-
-    elif command in ["MODE"]:
-        nickmask(prefix, kwargs)
-        if params[0][0] in "&#!+":
-            command = "CHANNELMODE"
-            kwargs["channel"] = params[0]
-            kwargs["modes"] = params[1]
-            if len(params) > 2:
-                kwargs["params"] = params[2:]
-            else:
-                kwargs["params"] = []
+        kwargs["modes"] = params[1]
+        if len(params) > 2:
+            kwargs["params"] = params[2:]
         else:
-            command = "USERMODE"
-            kwargs["nick"] = params[0]
-            kwargs["modes"] = params[1]
+            kwargs["params"] = []
+        return "CHANNELMODE"
+    kwargs["nick"] = params[0]
+    kwargs["modes"] = params[1]
+    return "USERMODE"
 
-    else:
-        raise ValueError("Unknown command '{}'".format(command))
 
+def unpack_command(msg: str) -> Tuple[str, Dict[str, Any]]:
+    unpacked = try_unpack_command(msg)
+    if unpacked is None:
+        # Split again to raise the specific reason the line was rejected
+        _, command, _ = split_line(msg.strip())
+        raise ValueError("Unknown command '{}'".format(synonym(command)))
+    return unpacked
+
+
+def try_unpack_hot_command(
+        msg: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Fast path for the lines most clients receive most often, in the exact
+    single-space shapes servers send them:
+
+        :<prefix> PRIVMSG <target> :<message>
+        :<prefix> NOTICE <target> :<message>
+        PING :<message>
+
+    Returns None for anything else, including unusual spacing or a newline
+    in the message, so that the line takes the general path through
+    RE_IRCLINE.
+    """
+    if msg.startswith("PING :"):
+        message = msg[6:]
+        if not message or "\n" in message:
+            return None
+        return "PING", {"message": message}
+
+    if msg[:1] != ":":
+        return None
+    prefix, _, rest = msg[1:].partition(" ")
+    verb, _, rest = rest.partition(" ")
+    command = _HOT_COMMANDS.get(verb)
+    if command is None:
+        return None
+    target, _, message = rest.partition(" :")
+    if not (prefix and target and message) or target[0] == ":":
+        return None
+    if "\n" in message:
+        return None
+    # Any other whitespace in prefix or target isn't printable
+    if " " in target or not (prefix + target).isprintable():
+        return None
+    kwargs = {}  # type: Dict[str, Any]
+    nickmask(prefix, kwargs)
+    kwargs["target"] = target
+    kwargs["message"] = message
     return command, kwargs
 
 
-def parameters(command: str) -> List[str]:
+def try_unpack_command(msg: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Same as unpack_command, but returns None for invalid lines and unknown
+    commands instead of raising.  Servers send plenty of replies bottom
+    doesn't unpack, so this keeps exceptions off the common path.
+    """
+    msg = msg.strip()
+    # Skip the fast path's call entirely for lines that can't be on it
+    if " PRIVMSG " in msg or " NOTICE " in msg or msg.startswith("PING :"):
+        unpacked = try_unpack_hot_command(msg)
+        if unpacked is not None:
+            return unpacked
+    parts = try_split_line(msg)
+    if parts is None:
+        return None
+    prefix, command, params = parts
     command = synonym(command)
-    params = []
-
-    if command in ["CLIENT_CONNECT", "CLIENT_DISCONNECT"]:
-        params.append("host")
-        params.append("port")
-
-    elif command in ["PING", "ERR_NOMOTD"]:
-        params.append("message")
-
-    elif command in ["PRIVMSG", "NOTICE"]:
-        add_nickmask(params)
-        params.append("target")
-        params.append("message")
-
-    elif command in ["JOIN"]:
-        add_nickmask(params)
-        params.append("channel")
-
-    elif command in ["NICK"]:
-        add_nickmask(params)
-        params.append("new_nick")
-
-    elif command in ["QUIT"]:
-        add_nickmask(params)
-        params.append("message")
-
-    elif command in ["RPL_WHOREPLY"]:
-        params.append("target")
-        params.append("channel")
-        params.append("user")
-        params.append("host")
-        params.append("server")
-        params.append("nick")
-        params.append("hg_code")
-        params.append("hopcount")
-        params.append("real_name")
-
-    elif command in ["RPL_NAMREPLY"]:
-        params.append("target")
-        params.append("channel_type")
-        params.append("channel")
-        params.append("users")
-
-    elif command in ["RPL_ENDOFWHO"]:
-        params.append("name")
-        params.append("message")
-
-    elif command in ["RPL_TOPIC", "RPL_NOTOPIC", "RPL_ENDOFNAMES", "TOPIC"]:
-        params.append("channel")
-        params.append("message")
-
-    elif command in ["PART"]:
-        add_nickmask(params)
-        params.append("channel")
-        params.append("message")
-
-    elif command in ["INVITE"]:
-        add_nickmask(params)
-        params.append("target")
-        params.append("channel")
-
-    elif command in ["RPL_MOTDSTART", "RPL_MOTD", "RPL_ENDOFMOTD",
-                     "RPL_WELCOME", "RPL_YOURHOST", "RPL_CREATED",
-                     "RPL_LUSERCLIENT", "RPL_LUSERME"]:
-        params.append("message")
-
-    elif command in ["RPL_LUSEROP", "RPL_LUSERUNKNOWN", "RPL_LUSERCHANNELS"]:
-        params.append("count")
-        params.append("message")
-
-    elif command in ["RPL_MYINFO", "RPL_BOUNCE"]:
-        params.append("info")
-        params.append("message")
-
-    elif command in ["USERMODE"]:
-        add_nickmask(params)
-        params.append("nick")
-        params.append("modes")
-
-    elif command in ["CHANNELMODE"]:
-        add_nickmask(params)
-        params.append("channel")
-        params.append("modes")
-        params.append("params")
+    unpacker = _unpackers.get(command)
+    if unpacker is None:
+        return None
+    kwargs = {}  # type: Dict[str, Any]
+    return unpacker(command, prefix, params, kwargs), kwargs
+
+
+_NICKMASK = ("nick", "user", "host")
+_parameters = {}  # type: Dict[str, Tuple[str, ...]]
+for commands, params in [
+    (("CLIENT_CONNECT", "CLIENT_DISCONNECT"), ("host", "port")),
+    (_MESSAGE_COMMANDS, ("message",)),
+    (_TARGETED_COMMANDS, _NICKMASK + ("target", "message")),
+    (("JOIN",), _NICKMASK + ("channel",)),
+    (("NICK",), _NICKMASK + ("new_nick",)),
+    (("QUIT",), _NICKMASK + ("message",)),
+    (("RPL_WHOREPLY",), ("target", "channel", "user", "host", "server",
+                         "nick", "hg_code", "hopcount", "real_name")),
+    (("RPL_NAMREPLY",), ("target", "channel_type", "channel", "users")),
+    (("RPL_ENDOFWHO",), ("name", "message")),
+    (_CHANNEL_MESSAGE_REPLIES + ("TOPIC",), ("channel", "message")),
+    (("PART",), _NICKMASK + ("channel", "message")),
+    (("INVITE",), _NICKMASK + ("target", "channel")),
+    (_MESSAGE_REPLIES, ("message",)),
+    (_COUNT_REPLIES, ("count", "message")),
+    (_INFO_REPLIES, ("info", "message")),
+    (("USERMODE",), _NICKMASK + ("nick", "modes")),
+    (("CHANNELMODE",), _NICKMASK + ("channel", "modes", "params")),
+]:
+    for command in commands:
+        _parameters[command] = params
 
-    else:
-        raise ValueError("Unknown command '{}'".format(command))
 
-    return params
+def parameters(command: str) -> List[str]:
+    command = synonym(command)
+    params = _parameters.get(command)
+    if params is None:
+        raise ValueError("Unknown command '{}'".format(command))
+    return list(params)
@@ -25,8 +25,8 @@ def waiter(client):
         if not events:
             return
         done, pending = await asyncio.wait(
-            [client.wait(event) for event in events],
-            loop=client.loop,
+            [client.loop.create_task(client.wait(event))
+             for event in events],
             return_when=return_when)
 
         # Get the result(s) of the completed task(s).
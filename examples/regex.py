@@ -1,7 +1,8 @@
-import asyncio
 import functools
 import re
 
+from bottom.client import ensure_async
+
 
 class Router(object):
     def __init__(self, client):
@@ -22,9 +23,7 @@ class Router(object):
             return functools.partial(self.route, pattern)
 
         # Decorator should always return the original function
-        wrapped = func
-        if not asyncio.iscoroutinefunction(wrapped):
-            wrapped = asyncio.coroutine(wrapped)
+        wrapped = ensure_async(func)
 
         compiled = re.compile(pattern)
         self.routes[compiled] = (wrapped, pattern)
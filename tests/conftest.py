@@ -0,0 +1,47 @@
+import collections
+import pytest
+# import ssl as _ssl
+
+from bottom.client import Client, normalize_event
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--uvloop", action="store_true",
+        help="run the integration tests on uvloop (must be installed)")
+
+
+@pytest.fixture
+def host():
+    return 'localhost'
+
+
+@pytest.fixture
+def port():
+    return 8888
+
+
+@pytest.fixture
+def ssl():
+    # TODO: make a working context
+    # return _ssl.create_default_context()
+    return None
+
+
+@pytest.fixture
+def client(loop, host, port, ssl):
+    """
+    Return a client that tracks triggers.  Each suite provides its own loop.
+    """
+    return TrackingClient(host=host, port=port, loop=loop, ssl=ssl)
+
+
+class TrackingClient(Client):
+    def __init__(self, *args, **kwargs):
+        self.triggers = collections.Counter()
+        super().__init__(*args, **kwargs)
+
+    def trigger(self, event, **kwargs):
+        event = normalize_event(event)
+        self.triggers[event] += 1
+        super().trigger(event, **kwargs)
@@ -1,33 +1,22 @@
 import asyncio
-import collections
 import pytest
-# import ssl as _ssl
 
-import bottom
 
-
-@pytest.fixture
-def host():
-    return 'localhost'
-
-
-@pytest.fixture
-def port():
-    return 8888
-
-
-@pytest.fixture
-def ssl():
-    # TODO: make a working context
-    # return _ssl.create_default_context()
-    return None
-
-
-@pytest.fixture
-def loop():
-    loop = asyncio.new_event_loop()
+@pytest.fixture(scope="module")
+def loop(request):
+    """
+    Share one loop across each module's tests; the server and client are
+    still created (and the server closed) per test.  Pass --uvloop to
+    compare against uvloop's event loop.
+    """
+    if request.config.getoption("--uvloop"):
+        import uvloop
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
     loop.set_debug(True)
-    return loop
+    yield loop
+    loop.close()
 
 
 @pytest.fixture
@@ -41,28 +30,13 @@ def flush(loop):
     return _flush
 
 
-@pytest.fixture
-def client(loop, host, port, ssl):
-    class TrackingClient(bottom.Client):
-        def __init__(self, *args, **kwargs):
-            self.triggers = collections.defaultdict(int)
-            super().__init__(*args, **kwargs)
-
-        def trigger(self, event, **kwargs):
-            event = event.upper()
-            self.triggers[event] += 1
-            super().trigger(event, **kwargs)
-
-    return TrackingClient(host=host, port=port, loop=loop, ssl=ssl)
-
-
 @pytest.fixture
 def protocol(client, loop):
     """Server side protocol"""
     class Protocol(asyncio.Protocol):
+        __slots__ = ("server", "buffer", "transport")
         delim = b"\n"
         delim_compat = b"\r\n"
-        buffer = b""
 
         @classmethod
         def factory(cls, server):
@@ -70,6 +44,7 @@ def protocol(client, loop):
 
         def __init__(self, server):
             self.server = server
+            self.buffer = bytearray()
             server.protocol = self
             super().__init__()
 
@@ -77,10 +52,15 @@ def protocol(client, loop):
             self.transport = transport
 
         def data_received(self, data):
-            self.buffer += data
+            buffer = self.buffer
+            buffer.extend(data)
             # Assume a strict server that only recognizes the spec's \r\n
-            *lines, self.buffer = self.buffer.split(b"\r\n")
-            for line in lines:
+            end = buffer.rfind(b"\r\n")
+            if end < 0:
+                return
+            complete = buffer[:end]
+            del buffer[:end + 2]
+            for line in complete.split(b"\r\n"):
                 incoming = line.decode(client.encoding, "ignore").strip()
                 self.server.handle(incoming)
 
@@ -96,9 +76,11 @@ def protocol(client, loop):
     return Protocol
 
 
-@pytest.yield_fixture
+@pytest.fixture
 def server(protocol, loop, host, port, ssl):
     class Server:
+        __slots__ = ("expected", "received", "sent", "protocol", "_server")
+
         def __init__(self):
             self.expected = {}
             self.received = []
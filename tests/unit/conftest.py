@@ -1,8 +1,6 @@
-from bottom.client import Client
 from bottom.protocol import Protocol
 import pytest
 import asyncio
-import collections
 NOT_CORO = "Can't schedule non-coroutine"
 
 
@@ -76,14 +74,6 @@ def transport(protocol):
     return Transport()
 
 
-@pytest.fixture
-def client(loop):
-    """
-    Return a client that tracks triggers and connects to reader/writer.
-    """
-    return TrackingClient("host", "port", loop=loop)
-
-
 @pytest.fixture
 def active_client(client, schedule):
     """Identical to client, but with protocol and transport wired up"""
@@ -91,20 +81,11 @@ def active_client(client, schedule):
     return client
 
 
-class TrackingClient(Client):
-    def __init__(self, *args, **kwargs):
-        self.triggers = collections.defaultdict(int)
-        super().__init__(*args, **kwargs)
-
-    def trigger(self, event, **kwargs):
-        event = event.upper()
-        self.triggers[event] += 1
-        super().trigger(event, **kwargs)
-
-
 class Watcher():
     """Exposes `call` function, `calls` attribute, and `called` property.
     Useful for lambdas that can't += a variable"""
+    __slots__ = ("calls",)
+
     def __init__(self):
         self.calls = 0
 
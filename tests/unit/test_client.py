@@ -1,6 +1,8 @@
 import asyncio
 import pytest
-from bottom.client import Client, RawClient, process
+from bottom.client import (
+    Client, RawClient, end_of_handlers, ensure_async, normalize_event,
+    process)
 
 
 def test_default_event_loop():
@@ -42,6 +44,39 @@ def test_stop_processing(loop, flush):
     ]
 
 
+def test_last_handler_next(loop, flush):
+    """ The last handler is given end_of_handlers, which is a no-op """
+    given = []
+
+    async def first(next_handler, message):
+        given.append(next_handler)
+        await next_handler(message)
+
+    async def last(next_handler, message):
+        given.append(next_handler)
+        await next_handler(message)
+
+    loop.create_task(process([first, last], "message"))
+    flush()
+    assert given[0] is not end_of_handlers
+    assert given[1] is end_of_handlers
+
+
+def test_handlers_after_rfc2812(active_client, protocol, flush):
+    """ rfc2812_handler passes lines on when it isn't the last handler """
+    received = []
+
+    async def after(next_handler, message):
+        received.append(message)
+        await next_handler(message)
+
+    active_client.raw_handlers.append(after)
+    protocol.data_received(b"PING :m\r\n")
+    flush()
+    assert received == ["PING :m"]
+    assert active_client.triggers["PING"] == 1
+
+
 def test_send_unknown_command(active_client, protocol):
     """ Sending an unknown command raises """
     assert active_client.protocol is protocol
@@ -49,6 +84,15 @@ def test_send_unknown_command(active_client, protocol):
         active_client.send("Unknown Command")
 
 
+def test_send_strips_for_send_raw(client):
+    """ send_raw overrides get the packed line without trailing spaces """
+    sent = []
+    client.send_raw = sent.append
+    client.send("JOIN", channel="#foo")
+    client.send("MOTD")
+    assert sent == ["JOIN #foo", "MOTD"]
+
+
 def test_send_before_connected(client, transport):
     """ Sending before connected raises """
     with pytest.raises(RuntimeError):
@@ -110,6 +154,12 @@ def test_unpack_triggers_client(active_client, protocol, flush):
     assert received == ["nick", "user", "host", "#target", "this is message"]
 
 
+def test_normalize_event():
+    """ event names are case-insensitive and reuse the normalized string """
+    assert normalize_event("privmsg") == "PRIVMSG"
+    assert normalize_event("privmsg") is normalize_event("privmsg")
+
+
 def test_on_signature(client):
     """ register a handler with full function signature options"""
     client.on("f")(lambda arg, *args, kw_only, kw_default="d", **kwargs: None)
@@ -121,12 +171,47 @@ def test_on_coroutine(client):
     client.on("f")(handle)
 
 
+def test_ensure_async(loop):
+    """ plain functions are wrapped, coroutine functions pass through """
+    async def handle():
+        pass
+    assert ensure_async(handle) is handle
+
+    def add(a, b=0):
+        return a + b
+    wrapped = ensure_async(add)
+    assert asyncio.iscoroutinefunction(wrapped)
+    assert wrapped.__name__ == "add"
+    assert loop.run_until_complete(wrapped(1, b=2)) == 3
+
+
+def test_on_async_callable(client, flush):
+    """ awaitables returned by a plain callable are awaited """
+    hits = []
+
+    class Handler:
+        async def __call__(self, **kwargs):
+            hits.append(kwargs)
+
+    client.on("f")(Handler())
+    client.trigger("f", a=1)
+    flush()
+    assert hits == [{"a": 1}]
+
+
 def test_trigger_no_handlers(client, flush):
     """ trigger an event with no handlers """
     client.trigger("some event")
     flush()
 
 
+def test_trigger_without_waiters(client, flush):
+    """ triggering an event no one waits on doesn't create a waitable """
+    client.trigger("f")
+    flush()
+    assert "F" not in client._events
+
+
 def test_trigger_one_handler(client, watch, flush):
     client.on("f")(lambda: watch.call())
     client.trigger("f")
@@ -187,19 +272,19 @@ def test_bound_method_of_instance(client, flush):
 
 def test_callback_ordering(client, flush):
     """ Callbacks for a second event don't queue behind the first event """
-    second_complete = asyncio.Event(loop=client.loop)
+    second_complete = client.loop.create_future()
     call_order = []
     complete_order = []
 
     async def first():
         call_order.append("first")
-        await second_complete.wait()
+        await second_complete
         complete_order.append("first")
 
     async def second():
         call_order.append("second")
         complete_order.append("second")
-        second_complete.set()
+        second_complete.set_result(None)
 
     client.on("f")(first)
     client.on("f")(second)
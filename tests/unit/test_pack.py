@@ -1,4 +1,4 @@
-from bottom.pack import pack_command
+from bottom.pack import pack_command, pack_command_kwargs
 import pytest
 import re
 SPACES = re.compile(r"(\\?\s+)+")
@@ -52,6 +52,15 @@ def test_ignore_case():
 
     assert "PASS foo" == pack_command("pASs", password="foo")
 
+
+def test_pack_command_kwargs():
+
+    """ takes the kwargs dict directly """
+
+    kwargs = {"target": "#chan", "message": "hi"}
+    assert pack_command_kwargs("PRIVMSG", kwargs) == \
+        pack_command("PRIVMSG", **kwargs) == "PRIVMSG #chan :hi"
+
 # =====================================
 # Specific command tests start here
 # =====================================
@@ -117,6 +126,9 @@ def test_join():
     assert like("JOIN ch1,ch2 k1,k2", pack_command("JOIN",
                                                    channel=["ch1", "ch2"],
                                                    key=["k1", "k2"]))
+    assert like("JOIN ch1,ch2", pack_command("JOIN", channel=("ch1", "ch2")))
+    assert like("JOIN ch1,ch2", pack_command(
+        "JOIN", channel=(c for c in ["ch1", "ch2"])))
 
 
 def test_part():
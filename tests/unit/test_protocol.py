@@ -1,3 +1,6 @@
+import logging
+
+
 def test_connection_made(protocol, transport):
     protocol.connection_made(transport)
     assert protocol.transport is transport
@@ -54,6 +57,22 @@ def test_multiline_chunk(protocol, transport, active_client, flush):
     assert active_client.triggers["PRIVMSG"] == 2
 
 
+def test_multibyte_split_across_chunks(protocol, transport, active_client,
+                                       flush):
+    """Multi-byte characters split between reads are decoded once whole"""
+    received = []
+
+    @active_client.on("PRIVMSG")
+    async def receive(message, **kwargs):
+        received.append(message)
+
+    data = ":nick!user@host PRIVMSG #target :caf\u00e9\r\n".encode("utf-8")
+    protocol.data_received(data[:-3])
+    protocol.data_received(data[-3:])
+    flush()
+    assert received == ["caf\u00e9"]
+
+
 def test_invalid_line(protocol, transport, active_client, flush):
     """Well-formatted but invalid line"""
     protocol.data_received(b"blah unknown command\r\n")
@@ -61,6 +80,27 @@ def test_invalid_line(protocol, transport, active_client, flush):
     assert list(active_client.triggers.keys()) == ['CLIENT_CONNECT']
 
 
+def test_invalid_line_logged(protocol, transport, active_client, flush,
+                             caplog):
+    """Unparsed lines are only logged when debug logging is enabled"""
+    protocol.data_received(b"blah unknown command\r\n")
+    flush()
+    assert not caplog.records
+
+    caplog.set_level(logging.DEBUG, logger="bottom.rfc2812_handler")
+    protocol.data_received(b"blah unknown command\r\n")
+    flush()
+    assert caplog.messages == [
+        "Failed to parse line >>> blah unknown command"]
+
+
+def test_malformed_known_command(protocol, transport, active_client, flush):
+    """Known command whose parameters can't be unpacked"""
+    protocol.data_received(b":host 252 nick not_a_count :operators\r\n")
+    flush()
+    assert list(active_client.triggers.keys()) == ['CLIENT_CONNECT']
+
+
 def test_close(protocol, transport, active_client):
     """Protocol.close triggers connection_lost,
     client triggers exactly 1 disconnect"""
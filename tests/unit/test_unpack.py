@@ -1,4 +1,6 @@
-from bottom.unpack import unpack_command, parameters, synonym
+from bottom.unpack import (
+    unpack_command, parameters, synonym, try_unpack_command,
+    try_unpack_hot_command, try_split_line)
 import pytest
 
 
@@ -24,6 +26,74 @@ def test_unknown_command():
         parameters("unknown_command")
 
 
+def test_try_unpack_command():
+    """ invalid lines and unknown commands return None instead of raising """
+    assert try_unpack_command("") is None
+    assert try_unpack_command(":prefix_only") is None
+    assert try_unpack_command("unknown_command") is None
+    # Known command, but the line itself is malformed
+    assert try_unpack_command(": PING :m") is None
+    assert ("PING", {"message": "m"}) == try_unpack_command("PING :m")
+
+
+def test_hot_command_shapes():
+    """ only the usual single-space shapes take the fast path """
+    expected = ("PRIVMSG", {"nick": "n", "user": "u", "host": "h",
+                            "target": "#t", "message": "m :x"})
+    assert try_unpack_hot_command(":n!u@h PRIVMSG #t :m :x") == expected
+    assert try_unpack_hot_command("PING :p") == ("PING", {"message": "p"})
+    nickmask = {"nick": "n", "user": "u", "host": "h"}
+    privmsg = ("PRIVMSG", dict(nickmask, target="#t", message="m"))
+    for line, unpacked in [
+            (":n!u@h PRIVMSG  #t :m", privmsg),
+            (":n!u@h\tPRIVMSG #t :m", privmsg),
+            (":n!u@h PRIVMSG #t\tx :m", privmsg),
+            # An empty message isn't a param, so the last param is used
+            (":n!u@h PRIVMSG #t :",
+             ("PRIVMSG", dict(nickmask, target="#t", message="#t"))),
+            (":n!u@h privmsg #t :m", privmsg),
+            # No prefix, as in the NOTICE AUTH lines sent before registering
+            ("NOTICE AUTH :hi",
+             ("NOTICE", {"host": "", "target": "AUTH", "message": "hi"})),
+            (":n!u@h JOIN #t", ("JOIN", dict(nickmask, channel="#t")))]:
+        assert try_unpack_hot_command(line) is None
+        # The general path still handles every one of them
+        assert try_unpack_command(line) == unpacked
+    assert try_unpack_hot_command("PING :") is None
+    # RE_IRCLINE rejects a newline in the message
+    for line in [":n!u@h PRIVMSG #t :hi\r\nPRIVMSG #x :spoof", "PING :a\nb"]:
+        assert try_unpack_hot_command(line) is None
+        with pytest.raises(ValueError):
+            unpack_command(line)
+
+
+def test_canonical_event_names():
+    """ both paths hand back the same interned event name object """
+    line = ":n!u@h PRIVMSG #t :m"
+    assert try_unpack_hot_command(line)[0] is synonym("PRIVMSG")
+    assert try_unpack_command(line.replace(" :", "  :"))[0] \
+        is synonym("PRIVMSG")
+
+
+def test_split_line_edge_cases():
+    """ odd spacing and stray whitespace split the way RE_IRCLINE does """
+    for line, parts in [
+            ("", None), (":p", None), (": CMD", None), ("CMD:x", None),
+            (":p CMD", ("p", "CMD", [])),
+            ("CMD a b :c d", ("", "CMD", ["a", "b", "c d"])),
+            (":p CMD a :", ("p", "CMD", ["a"])),
+            # A run of spaces before the ":" keeps it in the param
+            ("CMD  :a", ("", "CMD", [":a"])),
+            ("CMD a  :b c", ("", "CMD", ["a", ":b", "c"])),
+            ("CMD a\t:b", ("", "CMD", ["a", "b"])),
+            (":p\tCMD :a", ("p", "CMD", ["a"])),
+            ("CMD a:b :c:d", ("", "CMD", ["a:b", "c:d"])),
+            (" PING :x", None), ("\tCMD a", None),
+            ("PRIVMSG #a :x\n", ("", "PRIVMSG", ["#a", "x"])),
+            ("PRIVMSG #a :x\ny", None)]:
+        assert try_split_line(line) == parts
+
+
 def test_ignore_case():
     """ input case doesn't matter """
     assert ("PING", {"message": "m"}) == unpack_command("pInG :m")
@@ -35,6 +105,8 @@ def test_synonym():
     assert synonym("001") == synonym("RPL_WELCOME") == "RPL_WELCOME"
     # Unknown, even impossible commands
     assert synonym("!@#test") == synonym("!@#TEST") == "!@#TEST"
+    # Known commands always return the same string object
+    assert synonym("join") is synonym("JOIN")
 
 
 def validate(command, message, expected_kwargs):